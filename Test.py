@@ -1,37 +1,150 @@
 import os
 import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+MAX_WORKERS = 8
+PROGRESS_EVERY_N = 100
+PROGRESS_EVERY_SEC = 0.25
 
 SOURCE = r"C:\PATH\TO\YOUR\FOLDER"      # 🔴 CHANGE THIS
 DEST = r"E:\company_backup"             # 🔴 CHANGE THIS (USB path)
 
+def _walk(src):
+    # scandir-based walk: DirEntry carries type info, so no extra stat per
+    # entry. Directories are yielded before their contents so the mirror can
+    # recreate them (including empty ones) ahead of any file they contain.
+    with os.scandir(src) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield entry
+                yield from _walk(entry.path)
+            else:
+                yield entry
+
+
+def _copy_windows(src_file, dst_file):
+    # CopyFileExW copies inside the kernel (buffered, overlapped I/O) and
+    # preserves metadata; no user-space bounce buffer
+    import ctypes
+    if not ctypes.windll.kernel32.CopyFileExW(src_file, dst_file, None, None, None, 0):
+        raise ctypes.WinError()
+    st = os.stat(src_file)
+    os.utime(dst_file, (st.st_atime, st.st_mtime))
+
+
+def _copy_sendfile(src_file, dst_file):
+    # Zero-copy kernel transfer on Linux; fall through to copystat for metadata
+    with open(src_file, 'rb') as fsrc, open(dst_file, 'wb') as fdst:
+        src_fd = fsrc.fileno()
+        dst_fd = fdst.fileno()
+        offset = 0
+        while True:
+            sent = os.sendfile(dst_fd, src_fd, offset, 1 << 20)
+            if sent == 0:
+                break
+            offset += sent
+    shutil.copystat(src_file, dst_file)
+
+
+def _copy_one(task):
+    # Copy to a .part file and rename atomically so an interrupted run never
+    # leaves a truncated file under the final name
+    src_file, dst_file = task
+    tmp_file = dst_file + ".part"
+    try:
+        if os.name == 'nt':
+            _copy_windows(src_file, tmp_file)
+        elif hasattr(os, 'sendfile'):
+            _copy_sendfile(src_file, tmp_file)
+        else:
+            shutil.copy2(src_file, tmp_file)
+    except Exception:
+        # Fast path failed (special file, network share, etc.) — fall back
+        shutil.copy2(src_file, tmp_file)
+    os.replace(tmp_file, dst_file)
+    return src_file
+
+
+def _scan_existing(dst):
+    # One scandir pass over the destination replaces a stat call per source
+    # file; DirEntry.stat() reuses data the directory listing already fetched
+    existing = {}
+    if os.path.isdir(dst):
+        for entry in _walk(dst):
+            if entry.is_dir(follow_symlinks=False):
+                continue
+            st = entry.stat()
+            existing[os.path.relpath(entry.path, dst)] = (st.st_size, int(st.st_mtime))
+    return existing
+
+
 def copy_with_resume(src, dst):
+    # Single walk: collect copy tasks and pre-create destination dirs so
+    # worker threads never race on makedirs
     total_files = 0
     copied_files = 0
+    tasks = []
+    existing = _scan_existing(dst)
+    os.makedirs(dst, exist_ok=True)
+    created_dirs = {dst}
 
-    for root, dirs, files in os.walk(src):
-        total_files += len(files)
+    for entry in _walk(src):
+        src_file = entry.path
+        rel_path = os.path.relpath(src_file, src)
+        dst_file = os.path.join(dst, rel_path)
 
-    print(f"Total files to process: {total_files}\n")
+        # Recreate every source directory, not just parents of copied
+        # files — empty directories belong in the backup too
+        if entry.is_dir(follow_symlinks=False):
+            if dst_file not in created_dirs:
+                os.makedirs(dst_file, exist_ok=True)
+                created_dirs.add(dst_file)
+            continue
 
-    for root, dirs, files in os.walk(src):
-        rel_path = os.path.relpath(root, src)
-        dest_dir = os.path.join(dst, rel_path)
-        os.makedirs(dest_dir, exist_ok=True)
+        total_files += 1
 
-        for file in files:
-            src_file = os.path.join(root, file)
-            dst_file = os.path.join(dest_dir, file)
+        # makedirs stats every path component even with exist_ok=True, so
+        # only call it the first time we see a destination directory
+        dest_dir = os.path.dirname(dst_file)
+        if dest_dir not in created_dirs:
+            os.makedirs(dest_dir, exist_ok=True)
+            created_dirs.add(dest_dir)
 
-            if os.path.exists(dst_file):
-                continue
+        # Skip only when size and mtime match — an existence-only check would
+        # silently keep partial files from an interrupted run
+        st = entry.stat()
+        if existing.get(rel_path) == (st.st_size, int(st.st_mtime)):
+            continue
+
+        tasks.append((src_file, dst_file))
 
+    # Copy in parallel: copyfileobj releases the GIL during read/write, so
+    # threads overlap source-read latency with destination-write latency
+    # Progress is throttled: a print per file means a stdout flush per file,
+    # which dominates on trees with tens of thousands of small files
+    last_print = time.monotonic()
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {executor.submit(_copy_one, task): task for task in tasks}
+        for future in as_completed(futures):
+            src_file, _ = futures[future]
             try:
-                shutil.copy2(src_file, dst_file)
+                future.result()
                 copied_files += 1
-                print(f"[{copied_files}/{total_files}] Copied: {file}")
+                now = time.monotonic()
+                if copied_files % PROGRESS_EVERY_N == 0 or now - last_print > PROGRESS_EVERY_SEC:
+                    name = os.path.basename(src_file)[:40]
+                    sys.stdout.write(f"\r[{copied_files}/{len(tasks)}] {name:<40}")
+                    sys.stdout.flush()
+                    last_print = now
             except Exception as e:
-                print(f"❌ Failed: {src_file} → {e}")
+                print(f"\n❌ Failed: {src_file} → {e}")
+
+    sys.stdout.write(f"\r[{copied_files}/{len(tasks)}] done{' ' * 40}\n")
 
+    print(f"\nTotal files processed: {total_files}")
     print("\n✅ COPY COMPLETED SUCCESSFULLY")
 
 if __name__ == "__main__":
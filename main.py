@@ -7,10 +7,17 @@ Usage:
 """
 
 import argparse
+import pickle
 import sys
 from pathlib import Path
 import yaml
 
+# Prefer the libyaml C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 from src import (
     TemplateAnalyzer,
     ContentParser,
@@ -23,10 +30,31 @@ from src import (
 
 
 def load_config(config_path: str = "config/config.yaml") -> dict:
-    """Load configuration from YAML file"""
+    """Load configuration from YAML file (parsed result cached as a pickle)"""
     try:
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        config_file = Path(config_path)
+        cache_file = config_file.with_suffix(config_file.suffix + '.cache.pkl')
+
+        # Reuse the parsed config from a previous run when still fresh
+        yaml_mtime = config_file.stat().st_mtime
+        if cache_file.exists() and cache_file.stat().st_mtime >= yaml_mtime:
+            try:
+                with open(cache_file, 'rb') as f:
+                    return pickle.load(f)
+            except Exception:
+                pass  # Corrupt/stale cache - fall through to re-parse
+
+        with open(config_file, 'r', encoding='utf-8') as f:
+            config = yaml.load(f, Loader=_YamlLoader)
+
+        # Caching is best-effort (e.g. read-only config dir)
+        try:
+            with open(cache_file, 'wb') as f:
+                pickle.dump(config, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            pass
+
+        return config
     except FileNotFoundError:
         print(f"⚠️ Config file not found: {config_path}, using defaults")
         return {}
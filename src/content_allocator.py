@@ -11,7 +11,15 @@ class ContentAllocator:
     """
     Allocate content to slide templates using rule-based logic
     """
-    
+
+    # Acceptable substitutes per slide type, tried in order (tuples: one
+    # shared immutable instance instead of a dict literal per call)
+    _TYPE_MAPPINGS = {
+        'title': ('title', 'section_header'),
+        'content': ('content', 'two_column'),
+        'section_header': ('section_header', 'title'),
+    }
+
     def __init__(
         self, 
         template_structure: Dict, 
@@ -29,6 +37,13 @@ class ContentAllocator:
         # Configuration
         self.max_bullets = self.config.get('max_bullets_per_slide', 6)
         self.max_bullet_length = self.config.get('max_bullet_length', 200)
+
+        # Index templates by slide type once so per-slide lookup is O(1)
+        # instead of a linear scan per allocated slide
+        self._templates_by_type: Dict[str, Dict] = {}
+        for template in self.template.get('slides', []):
+            self._templates_by_type.setdefault(template['slide_type'], template)
+        self._default_template: Optional[Dict] = None
     
     def allocate(self) -> List[Dict]:
         """
@@ -65,29 +80,45 @@ class ContentAllocator:
                 continue
         
         self.error_handler.log_info(
-            f"Allocation complete: {len(self.allocation_plan)} slides planned"
+            "Allocation complete: %d slides planned", len(self.allocation_plan)
         )
         
         return self.allocation_plan
     
-    def _allocate_single_slide(self, slide_data: Dict, idx: int) -> Dict:
-        """Allocate single slide content to template"""
-        
+    def _allocate_single_slide(
+        self,
+        slide_data: Dict,
+        idx: int,
+        content_override: Optional[List[str]] = None,
+        title_override: Optional[str] = None
+    ) -> Dict:
+        """
+        Allocate single slide content to template
+
+        Args:
+            slide_data: Source slide dictionary
+            idx: Slide index
+            content_override: Content to use instead of slide_data['content']
+            title_override: Title to use instead of slide_data['title']
+        """
+
         slide_type = slide_data.get('type', 'content')
-        
+
         # Find matching template
         template_slide = self._find_best_template(slide_type)
-        
+
         if not template_slide:
             self.error_handler.log_warning(
-                f"No template found for type '{slide_type}', using default"
+                "No template found for type '%s', using default", slide_type
             )
             template_slide = self._get_default_template()
-        
+
         # Map content to placeholders
         placeholder_mapping = self._map_content_to_placeholders(
             slide_data,
-            template_slide
+            template_slide,
+            content_override=content_override,
+            title_override=title_override
         )
         
         allocation = {
@@ -103,97 +134,122 @@ class ContentAllocator:
     
     def _find_best_template(self, slide_type: str) -> Optional[Dict]:
         """Find best matching template for slide type"""
-        
-        template_slides = self.template.get('slides', [])
-        
+
         # Exact match
-        for template in template_slides:
-            if template['slide_type'] == slide_type:
-                return template
-        
+        template = self._templates_by_type.get(slide_type)
+        if template:
+            return template
+
         # Partial match (for flexibility)
-        type_mappings = {
-            'title': ['title', 'section_header'],
-            'content': ['content', 'two_column'],
-            'section_header': ['section_header', 'title'],
-        }
-        
-        alternatives = type_mappings.get(slide_type, [])
-        for alt_type in alternatives:
-            for template in template_slides:
-                if template['slide_type'] == alt_type:
-                    return template
-        
+        for alt_type in self._TYPE_MAPPINGS.get(slide_type, ()):
+            template = self._templates_by_type.get(alt_type)
+            if template:
+                return template
+
         return None
-    
+
     def _get_default_template(self) -> Dict:
-        """Get default content template"""
+        """Get default content template (computed once, then cached)"""
+        if self._default_template is not None:
+            return self._default_template
+
         template_slides = self.template.get('slides', [])
-        
-        # Try to find a content slide
-        for template in template_slides:
-            if template['slide_type'] == 'content':
-                return template
-        
-        # Fallback to first slide with body placeholder
-        for template in template_slides:
-            if template.get('has_body', False):
-                return template
-        
+        default = self._templates_by_type.get('content')
+
+        if default is None:
+            # Fallback to first slide with body placeholder
+            for template in template_slides:
+                if template.get('has_body', False):
+                    default = template
+                    break
+
         # Last resort: first slide
-        if template_slides:
-            return template_slides[0]
-        
-        raise AllocationError("No valid template found")
+        if default is None and template_slides:
+            default = template_slides[0]
+
+        if default is None:
+            raise AllocationError("No valid template found")
+
+        self._default_template = default
+        return default
     
+    @staticmethod
+    def _classify_placeholders(template: Dict):
+        """
+        Split template placeholders into title and body lists
+
+        Classification runs once per template dict and is memoized on the
+        dict itself, so per-slide mapping does no substring checks.
+        """
+        if '_title_phs' not in template:
+            title_phs = []
+            body_phs = []
+
+            for placeholder in template.get('placeholders', []):
+                ph_type = placeholder['placeholder_type']
+                if 'TITLE' in ph_type or 'CENTERED_TITLE' in ph_type:
+                    title_phs.append(placeholder)
+                elif 'BODY' in ph_type or 'OBJECT' in ph_type:
+                    body_phs.append(placeholder)
+
+            template['_title_phs'] = title_phs
+            template['_body_phs'] = body_phs
+
+        return template['_title_phs'], template['_body_phs']
+
     def _map_content_to_placeholders(
-        self, 
-        slide_data: Dict, 
-        template: Dict
+        self,
+        slide_data: Dict,
+        template: Dict,
+        content_override: Optional[List[str]] = None,
+        title_override: Optional[str] = None
     ) -> Dict:
         """Map content fields to specific placeholders"""
-        
+
         mapping = {}
-        placeholders = template.get('placeholders', [])
-        
-        for placeholder in placeholders:
+        title_phs, body_phs = self._classify_placeholders(template)
+
+        # Handle title placeholders
+        for placeholder in title_phs:
             ph_idx = placeholder['placeholder_idx']
-            ph_type = placeholder['placeholder_type']
             max_chars = placeholder['max_chars']
-            
-            # Handle title placeholders
-            if 'TITLE' in ph_type or 'CENTERED_TITLE' in ph_type:
-                title = slide_data.get('title', '')
-                
-                # Truncate if needed
-                if len(title) > max_chars:
-                    title = self.text_processor.truncate_smart(title, max_chars)
-                
-                mapping[ph_idx] = {
-                    'text': title,
-                    'type': 'title',
-                    'format': 'plain'
-                }
-            
-            # Handle body/content placeholders
-            elif 'BODY' in ph_type or 'OBJECT' in ph_type:
-                content_items = slide_data.get('content', [])
-                
-                if isinstance(content_items, str):
-                    content_items = [content_items]
-                
-                # Fit content to placeholder
-                fitted_content = self._fit_content_to_placeholder(
-                    content_items,
-                    max_chars
-                )
-                
-                mapping[ph_idx] = {
-                    'text': fitted_content,
-                    'type': 'body',
-                    'format': 'bullets'
-                }
-        
+
+            title = title_override if title_override is not None \
+                else slide_data.get('title', '')
+
+            # Truncate if needed
+            if len(title) > max_chars:
+                title = self.text_processor.truncate_smart(title, max_chars)
+
+            mapping[ph_idx] = {
+                'text': title,
+                'type': 'title',
+                'format': 'plain'
+            }
+
+        # Handle body/content placeholders
+        for placeholder in body_phs:
+            ph_idx = placeholder['placeholder_idx']
+            max_chars = placeholder['max_chars']
+
+            content_items = content_override if content_override is not None \
+                else slide_data.get('content', [])
+
+            if isinstance(content_items, str):
+                content_items = [content_items]
+
+            # Fit content to placeholder
+            fitted_content = self._fit_content_to_placeholder(
+                content_items,
+                max_chars
+            )
+
+            mapping[ph_idx] = {
+                'text': fitted_content,
+                'type': 'body',
+                'format': 'bullets'
+            }
+
         return mapping
     
     def _fit_content_to_placeholder(
@@ -255,12 +311,15 @@ class ContentAllocator:
         # Split if too many items
         if len(content) > self.max_bullets * 1.5:
             return True
-        
-        # Split if total content too long
-        total_chars = sum(len(str(item)) for item in content)
-        if total_chars > 2000:  # Arbitrary threshold
-            return True
-        
+
+        # Split if total content too long - accumulate with early exit so we
+        # stop scanning as soon as the threshold is crossed
+        total_chars = 0
+        for item in content:
+            total_chars += len(item) if isinstance(item, str) else len(str(item))
+            if total_chars > 2000:  # Arbitrary threshold
+                return True
+
         return False
     
     def _split_slide_content(
@@ -271,7 +330,7 @@ class ContentAllocator:
         """Split slide content into multiple slides"""
         
         self.error_handler.log_info(
-            f"Splitting slide {idx + 1} due to content overflow"
+            "Splitting slide %d due to content overflow", idx + 1
         )
         
         content = slide_data.get('content', [])
@@ -286,20 +345,20 @@ class ContentAllocator:
         )
         
         allocations = []
-        
+        original_title = slide_data.get('title', '')
+
         for chunk_idx, chunk in enumerate(content_chunks):
-            # Create modified slide data for each chunk
-            chunk_slide_data = slide_data.copy()
-            chunk_slide_data['content'] = chunk
-            
-            # Modify title for continuation slides
-            if chunk_idx > 0:
-                original_title = slide_data.get('title', '')
-                chunk_slide_data['title'] = f"{original_title} (cont.)"
-            
-            allocation = self._allocate_single_slide(chunk_slide_data, idx)
+            # Pass overrides instead of copying the whole slide dict per chunk
+            title = f"{original_title} (cont.)" if chunk_idx > 0 else None
+
+            allocation = self._allocate_single_slide(
+                slide_data,
+                idx,
+                content_override=chunk,
+                title_override=title
+            )
             allocations.append(allocation)
-        
+
         return allocations
     
     def get_allocation_summary(self) -> Dict:
@@ -2,11 +2,21 @@
 Error handling and logging utilities
 """
 
+import atexit
 import logging
+from functools import lru_cache
+from logging.handlers import MemoryHandler
 from typing import Optional
 from pathlib import Path
 
 
+@lru_cache(maxsize=128)
+def _path_exists(path_str: str) -> bool:
+    """Memoized existence check - the same template/input paths get
+    re-validated by every constructor in the pipeline"""
+    return Path(path_str).exists()
+
+
 class PPTAutomationError(Exception):
     """Base exception for PPT automation system"""
     pass
@@ -27,38 +37,78 @@ class AllocationError(PPTAutomationError):
     pass
 
 
+# Logging is process-wide state: configure it once, however many
+# ErrorHandler facades get constructed (every module builds its own)
+_CONFIGURED: bool = False
+_LOGGER: Optional[logging.Logger] = None
+_MEMORY_HANDLER: Optional[MemoryHandler] = None
+
+
 class ErrorHandler:
     """Centralized error handling and logging"""
-    
+
     def __init__(self, log_dir: str = "logs/"):
         self.log_dir = Path(log_dir)
-        self.log_dir.mkdir(exist_ok=True)
-        
+
         self._setup_logging()
-    
+
     def _setup_logging(self):
-        """Configure logging"""
+        """Configure logging once per process; later calls reuse it"""
+        global _CONFIGURED, _LOGGER, _MEMORY_HANDLER
+
+        if _CONFIGURED:
+            self.logger = _LOGGER
+            self._memory_handler = _MEMORY_HANDLER
+            return
+
+        self.log_dir.mkdir(exist_ok=True)
         log_file = self.log_dir / "ppt_automation.log"
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_file),
-                logging.StreamHandler()
-            ]
+
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
-        
-        self.logger = logging.getLogger(__name__)
-    
-    def log_info(self, message: str):
-        """Log info message"""
-        self.logger.info(message)
+
+        file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
+
+        # Coalesce routine INFO/WARNING records into batched writes; ERROR
+        # and above flush to disk immediately
+        self._memory_handler = MemoryHandler(
+            capacity=512,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+
+        root = logging.getLogger()
+        # Same semantics basicConfig had: leave existing config alone
+        if not root.handlers:
+            root.setLevel(logging.INFO)
+            root.addHandler(self._memory_handler)
+            root.addHandler(stream_handler)
+            atexit.register(self._memory_handler.flush)
+
+        self.logger = logging.getLogger("ppt_automation")
+
+        _LOGGER = self.logger
+        _MEMORY_HANDLER = self._memory_handler
+        _CONFIGURED = True
+
+    def flush(self):
+        """Flush buffered log records to disk"""
+        self._memory_handler.flush()
     
-    def log_warning(self, message: str):
+    def log_info(self, message: str, *args):
+        """Log info message (args defer formatting until the record is emitted)"""
+        self.logger.info(message, *args)
+
+    def log_warning(self, message: str, *args):
         """Log warning"""
-        self.logger.warning(message)
-    
+        self.logger.warning(message, *args)
+
     def log_error(self, message: str, exc_info: Optional[Exception] = None):
         """Log error"""
         self.logger.error(message, exc_info=exc_info)
@@ -87,12 +137,22 @@ class ErrorHandler:
         }
     
     @staticmethod
-    def validate_file_exists(file_path: str) -> bool:
-        """Validate file exists"""
-        path = Path(file_path)
-        if not path.exists():
+    def validate_file_exists(file_path) -> bool:
+        """
+        Validate file exists (result cached per path)
+
+        Args:
+            file_path: str or Path - no re-wrapping when already a str
+        """
+        path_str = file_path if isinstance(file_path, str) else str(file_path)
+        if not _path_exists(path_str):
             raise FileNotFoundError(f"File not found: {file_path}")
         return True
+
+    @staticmethod
+    def invalidate_path_cache():
+        """Clear the cached existence checks (after files are rewritten)"""
+        _path_exists.cache_clear()
     
     @staticmethod
     def validate_template_structure(template_data: dict) -> bool:
@@ -5,10 +5,23 @@ PowerPoint slide generation using python-pptx
 from pptx import Presentation
 from pptx.util import Pt, Inches
 from pptx.enum.text import PP_ALIGN
+from lxml import etree
+from xml.sax.saxutils import escape
 from pathlib import Path
 from typing import List, Dict
+import io
 
 from .error_handler import ErrorHandler
+from .template_analyzer import load_template_presentation
+
+_A_NS = 'http://schemas.openxmlformats.org/drawingml/2006/main'
+
+# Fallback text box geometry - Inches() allocates an Emu wrapper, so build
+# these once instead of per invocation
+_FALLBACK_LEFT = Inches(1)
+_FALLBACK_TOP = Inches(2)
+_FALLBACK_WIDTH = Inches(8)
+_FALLBACK_HEIGHT = Inches(4)
 
 
 class SlideGenerator:
@@ -38,61 +51,115 @@ class SlideGenerator:
             Path to generated file
         """
         self.error_handler.log_info(
-            f"Generating presentation: {len(allocation_plan)} slides"
+            "Generating presentation: %d slides", len(allocation_plan)
         )
         
-        # Load fresh template
-        self.prs = Presentation(str(self.template_path))
-        
+        # Load fresh template (from the shared in-memory byte cache, so the
+        # analyzer's read is not repeated from disk)
+        self.prs = load_template_presentation(self.template_path)
+
         # Clear existing slides
         self._clear_all_slides()
-        
-        # Generate slides from plan
+
+        self._build_slides(allocation_plan)
+
+        return self._save(output_path)
+
+    def generate_batch(self, plans_by_output: Dict[str, List[Dict]]) -> List[str]:
+        """
+        Generate several presentations in one call
+
+        The template is loaded and cleared once, then snapshotted to an
+        in-memory buffer; each output deck starts from its own Presentation
+        parsed off that snapshot. Per-deck cost is slide creation plus save,
+        not template re-read plus slide clearing.
+
+        Args:
+            plans_by_output: Mapping of output path -> allocation plan
+
+        Returns:
+            List of generated file paths
+        """
+        self.error_handler.log_info(
+            "Generating %d presentations in batch", len(plans_by_output)
+        )
+
+        self.prs = load_template_presentation(self.template_path)
+        self._clear_all_slides()
+
+        snapshot = io.BytesIO()
+        self.prs.save(snapshot)
+        cleared_bytes = snapshot.getvalue()
+
+        outputs = []
+        for output_path, allocation_plan in plans_by_output.items():
+            self.prs = Presentation(io.BytesIO(cleared_bytes))
+            self._build_slides(allocation_plan)
+            outputs.append(self._save(output_path))
+
+        return outputs
+
+    def _build_slides(self, allocation_plan: List[Dict]):
+        """Create every slide in the plan on the loaded presentation"""
+        # Layout indices are validated up front so the common case runs
+        # without per-slide exception handling; only plans with a bad index
+        # take the guarded fallback path.
+        n_layouts = len(self.prs.slide_layouts)
+
         for idx, slide_plan in enumerate(allocation_plan):
-            try:
-                self._create_slide(slide_plan)
-            except Exception as e:
-                self.error_handler.log_error(
-                    f"Error creating slide {idx + 1}: {e}", e
+            layout_idx = slide_plan.get('template_slide_idx', 0)
+
+            if 0 <= layout_idx < n_layouts:
+                self._create_slide(slide_plan, layout_idx)
+            else:
+                self.error_handler.log_warning(
+                    "Invalid layout index %d, using layout 0", layout_idx
                 )
-                # Continue with next slide
-                continue
-        
-        # Save output
+                try:
+                    self._create_slide(slide_plan, 0)
+                except Exception as e:
+                    self.error_handler.log_error(
+                        f"Error creating slide {idx + 1}: {e}", e
+                    )
+                    # Continue with next slide
+                    continue
+
+    def _save(self, output_path: str) -> str:
+        """Save the loaded presentation to disk"""
         output_path = Path(output_path)
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        
+
+        # is_dir() is one stat; mkdir(parents=True, exist_ok=True) walks
+        # every path component even when the directory already exists
+        parent = output_path.parent
+        if not parent.is_dir():
+            parent.mkdir(parents=True, exist_ok=True)
+
         self.prs.save(str(output_path))
-        
-        self.error_handler.log_info(f"✅ Presentation saved: {output_path}")
-        
+
+        self.error_handler.log_info("✅ Presentation saved: %s", output_path)
+
         return str(output_path)
-    
+
     def _clear_all_slides(self):
         """Remove all slides from presentation"""
         xml_slides = self.prs.slides._sldIdLst
-        slides_to_remove = list(range(len(xml_slides)))
-        
-        for idx in reversed(slides_to_remove):
-            xml_slides.remove(xml_slides[idx])
+
+        # One linear pass over the child elements; indexing into an lxml
+        # element as the old reversed-range loop did is O(n) per access.
+        # Dropping each slide's relationship keeps the package from
+        # accumulating orphaned slide parts across generate() calls.
+        for sld_id in list(xml_slides):
+            self.prs.part.drop_rel(sld_id.rId)
+            xml_slides.remove(sld_id)
     
-    def _create_slide(self, slide_plan: Dict):
+    def _create_slide(self, slide_plan: Dict, layout_idx: int):
         """
         Create individual slide from plan
-        
+
         Args:
             slide_plan: Allocation dictionary for this slide
+            layout_idx: Validated layout index (bounds-checked by generate())
         """
-        # Get layout index
-        layout_idx = slide_plan.get('template_slide_idx', 0)
-        
-        # Ensure layout index is valid
-        if layout_idx >= len(self.prs.slide_layouts):
-            self.error_handler.log_warning(
-                f"Invalid layout index {layout_idx}, using layout 0"
-            )
-            layout_idx = 0
-        
         # Add slide with layout
         layout = self.prs.slide_layouts[layout_idx]
         slide = self.prs.slides.add_slide(layout)
@@ -126,7 +193,7 @@ class SlideGenerator:
             placeholder = slide.placeholders[ph_idx]
         except KeyError:
             self.error_handler.log_warning(
-                f"Placeholder {ph_idx} not found, attempting fallback"
+                "Placeholder %s not found, attempting fallback", ph_idx
             )
             self._add_text_box_fallback(slide, content_data)
             return
@@ -162,21 +229,30 @@ class SlideGenerator:
         
         text_frame = placeholder.text_frame
         text_frame.clear()  # Clear existing content
-        
-        # Add bullet points
-        for idx, bullet in enumerate(items):
-            if idx == 0:
-                # Use first paragraph
-                p = text_frame.paragraphs[0]
-            else:
-                # Add new paragraph
-                p = text_frame.add_paragraph()
-            
-            p.text = str(bullet)
-            p.level = 0  # Top-level bullet
-            
-            # Optional: Set bullet formatting
-            # p.font.size = Pt(18)
+
+        # Coerce and escape every bullet up front, one C-level pass each,
+        # instead of interleaving str()/escape() with XML assembly
+        bullets = [str(bullet) for bullet in items]
+        escaped = [escape(bullet) for bullet in bullets]
+
+        # First bullet reuses the paragraph clear() left behind
+        text_frame.paragraphs[0].text = bullets[0]
+
+        # Remaining bullets: build all paragraph XML in one string, parse it
+        # once, and splice the elements in - each add_paragraph()/text
+        # assignment round-trip mutates the lxml subtree separately
+        if len(escaped) > 1:
+            paragraphs_xml = ''.join(
+                f'<a:p><a:r><a:t>{text}</a:t></a:r></a:p>'
+                for text in escaped[1:]
+            )
+            fragment = etree.fromstring(
+                f'<root xmlns:a="{_A_NS}">{paragraphs_xml}</root>'
+            )
+
+            txBody = text_frame._txBody
+            for p in fragment:
+                txBody.append(p)
     
     def _fill_plain_text(self, placeholder, content_data: Dict):
         """Fill placeholder with plain text"""
@@ -198,12 +274,9 @@ class SlideGenerator:
         self.error_handler.log_info("Using text box fallback for missing placeholder")
         
         # Add text box in center of slide
-        left = Inches(1)
-        top = Inches(2)
-        width = Inches(8)
-        height = Inches(4)
-        
-        text_box = slide.shapes.add_textbox(left, top, width, height)
+        text_box = slide.shapes.add_textbox(
+            _FALLBACK_LEFT, _FALLBACK_TOP, _FALLBACK_WIDTH, _FALLBACK_HEIGHT
+        )
         text_frame = text_box.text_frame
         
         text = content_data.get('text', '')
@@ -228,7 +301,7 @@ class SlideGenerator:
             text_frame = notes_slide.notes_text_frame
             text_frame.text = notes
         except Exception as e:
-            self.error_handler.log_warning(f"Could not add notes: {e}")
+            self.error_handler.log_warning("Could not add notes: %s", e)
     
     def add_metadata(self, properties: Dict):
         """
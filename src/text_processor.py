@@ -4,12 +4,20 @@ No LLMs - only local, deterministic algorithms
 """
 
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import List, Dict, Tuple
 import numpy as np
 
 # Optional imports - graceful degradation if not available
 try:
-    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.feature_extraction.text import (
+        ENGLISH_STOP_WORDS,
+        HashingVectorizer,
+        TfidfTransformer,
+        TfidfVectorizer,
+    )
     SKLEARN_AVAILABLE = True
 except ImportError:
     SKLEARN_AVAILABLE = False
@@ -18,13 +26,25 @@ try:
     import nltk
     from nltk.tokenize import sent_tokenize, word_tokenize
     from nltk.corpus import stopwords
-    
+
+    # punkt_tab-backed tokenizer class, only present on nltk >= 3.9
+    try:
+        from nltk.tokenize import PunktTokenizer
+    except ImportError:
+        PunktTokenizer = None
+
     # Download required NLTK data
     try:
         nltk.data.find('tokenizers/punkt')
     except LookupError:
         nltk.download('punkt', quiet=True)
-    
+
+    if PunktTokenizer is not None:
+        try:
+            nltk.data.find('tokenizers/punkt_tab')
+        except LookupError:
+            nltk.download('punkt_tab', quiet=True)
+
     try:
         nltk.data.find('corpora/stopwords')
     except LookupError:
@@ -34,8 +54,91 @@ try:
 except ImportError:
     NLTK_AVAILABLE = False
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
 from .error_handler import ErrorHandler
 
+# Words of 4+ lowercase letters - compiled once at import, the pattern
+# already enforces the minimum length so no per-word check is needed
+_KW_RE = re.compile(r'\b[a-z]{4,}\b')
+
+# Same token shape sklearn's default token_pattern accepts (2+ word chars)
+_TOKEN_RE = re.compile(r'\b\w\w+\b')
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _csr_dot_dense(data, indices, indptr, n_rows, query):
+        """Dot each CSR row against a dense query vector (compiled)"""
+        out = np.empty(n_rows)
+        for i in range(n_rows):
+            acc = 0.0
+            for j in range(indptr[i], indptr[i + 1]):
+                acc += data[j] * query[indices[j]]
+            out[i] = acc
+        return out
+
+# Hot-path patterns compiled once at import rather than per call.
+# The boundary split keeps sentence terminators attached, matching what
+# Punkt returns on the NLTK path.
+_SENT_BOUNDARY_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z])')
+_MULTISPACE_RE = re.compile(r'\s+')
+
+# Last sentence terminator in a string, found in one scan instead of
+# three separate rfind passes
+_LAST_PUNCT_RE = re.compile(r'[.!?][^.!?]*\Z')
+
+# Below this many items, thread-pool startup costs more than it saves
+_PARALLEL_MIN_ITEMS = 32
+
+
+@lru_cache(maxsize=1024)
+def _clean_bullet_impl(text: str) -> str:
+    """
+    Clean and format bullet point text
+
+    Decks repeat boilerplate bullets across slides; memoizing at module
+    level means each distinct string pays for the regex and rebuild once.
+    """
+    text = text.strip()
+
+    # Remove multiple spaces
+    text = _MULTISPACE_RE.sub(' ', text)
+
+    # Capitalize first letter
+    if text and text[0].islower():
+        text = text[0].upper() + text[1:]
+
+    # Ensure ends with period if not already punctuated
+    if text and text[-1] not in '.!?':
+        text += '.'
+
+    return text
+
+
+@lru_cache(maxsize=64)
+def _hashed_tfidf(corpus: Tuple[str, ...]):
+    """
+    TF-IDF matrix via the hashing trick, memoized per corpus
+
+    HashingVectorizer needs no vocabulary pass - terms hash straight to
+    column indices - which is all the scoring paths require since they
+    never look up feature names.
+    """
+    # float32 halves the matrix footprint; the transformer preserves the
+    # input dtype, so nothing upcasts downstream
+    hasher = HashingVectorizer(
+        n_features=2 ** 14,
+        alternate_sign=False,
+        ngram_range=(1, 2),
+        stop_words='english',
+        dtype=np.float32
+    )
+    return TfidfTransformer().fit_transform(hasher.transform(corpus))
+
 
 class TextProcessor:
     """
@@ -45,20 +148,42 @@ class TextProcessor:
     
     def __init__(self):
         self.error_handler = ErrorHandler()
-        self.vectorizer = None
-        
-        if SKLEARN_AVAILABLE:
-            self.vectorizer = TfidfVectorizer(
-                max_features=100,
-                stop_words='english',
-                ngram_range=(1, 2)
-            )
-        
+
+        # term -> IDF weight, populated by warmup_corpus(); empty means
+        # score with the per-corpus hashed TF-IDF pipeline instead
+        self._idf: Dict[str, float] = {}
+
+        # Strategy bound once at construction - callers dispatch through
+        # the attribute instead of re-testing NLTK_AVAILABLE per call
+        if NLTK_AVAILABLE:
+            self._sent_tokenize = self._bind_punkt()
+        else:
+            self._sent_tokenize = self._simple_sentence_split
+
         if not NLTK_AVAILABLE:
             self.error_handler.log_warning(
                 "NLTK not available. Using simple text processing."
             )
-    
+
+    def _bind_punkt(self):
+        """
+        Bind a Punkt tokenize method once, pre-warmed
+
+        nltk >= 3.9 ships the model as punkt_tab (via PunktTokenizer);
+        older versions load the legacy punkt pickle. When neither model
+        is on disk, the regex splitter is bound instead - unlike
+        sent_tokenize it cannot raise at call time.
+        """
+        if PunktTokenizer is not None:
+            try:
+                return PunktTokenizer().tokenize
+            except LookupError:
+                pass
+        try:
+            return nltk.data.load('tokenizers/punkt/english.pickle').tokenize
+        except LookupError:
+            return self._simple_sentence_split
+
     def summarize_to_bullets(
         self, 
         text: str, 
@@ -77,76 +202,139 @@ class TextProcessor:
         Returns:
             List of bullet point strings
         """
-        if not text or not text.strip():
-            return []
-        
-        # Tokenize into sentences
-        if NLTK_AVAILABLE:
-            sentences = sent_tokenize(text)
-        else:
-            sentences = self._simple_sentence_split(text)
-        
-        # Filter short sentences
-        sentences = [s for s in sentences if len(s) >= min_sentence_length]
-        
-        if len(sentences) <= max_bullets:
-            return [self._clean_bullet(s) for s in sentences]
-        
-        # Use TF-IDF scoring if available
-        if SKLEARN_AVAILABLE and self.vectorizer:
+        return self.summarize_to_bullets_batch(
+            [text], max_bullets, min_sentence_length
+        )[0]
+
+    def summarize_to_bullets_batch(
+        self,
+        texts: List[str],
+        max_bullets: int = 5,
+        min_sentence_length: int = 20
+    ) -> List[List[str]]:
+        """
+        Summarize several texts with one scoring pass
+
+        All sentences across all texts go through a single TF-IDF
+        transform; each text's scores are then recovered by slicing at
+        the sentence-count boundaries. Besides amortizing the vectorizer
+        cost, sharing the IDF statistics across the batch down-weights
+        deck-wide boilerplate.
+
+        Args:
+            texts: Input texts, one per slide
+            max_bullets: Maximum number of bullets per text
+            min_sentence_length: Minimum characters per sentence
+
+        Returns:
+            One bullet-point list per input text
+        """
+        per_text = []
+        for text in texts:
+            if not text or not text.strip():
+                per_text.append([])
+                continue
+            sentences = self._sent_tokenize(text)
+            per_text.append([s for s in sentences if len(s) >= min_sentence_length])
+
+        # Score only when at least one text actually needs trimming
+        scores = None
+        if SKLEARN_AVAILABLE and any(len(s) > max_bullets for s in per_text):
+            flat = [sent for sentences in per_text for sent in sentences]
             try:
-                scored_sentences = self._score_sentences_tfidf(sentences)
+                scores = self._score_sentences_tfidf(flat)
+            except Exception as e:
+                self.error_handler.log_warning(f"TF-IDF scoring failed: {e}")
+
+        bounds = np.concatenate(
+            ([0], np.cumsum([len(sentences) for sentences in per_text]))
+        )
+
+        results = []
+        for i, sentences in enumerate(per_text):
+            if len(sentences) <= max_bullets:
+                results.append([self._clean_bullet(s) for s in sentences])
+            elif scores is not None:
                 top_sentences = self._get_top_sentences(
-                    scored_sentences, 
+                    sentences,
+                    scores[bounds[i]:bounds[i + 1]],
                     max_bullets
                 )
-                return [self._clean_bullet(s) for s in top_sentences]
-            except Exception as e:
-                self.error_handler.log_warning(f"TF-IDF scoring failed: {e}")
-        
-        # Fallback: return first N sentences
-        return [self._clean_bullet(s) for s in sentences[:max_bullets]]
+                results.append([self._clean_bullet(s) for s in top_sentences])
+            else:
+                # Fallback: first N sentences
+                results.append([self._clean_bullet(s) for s in sentences[:max_bullets]])
+
+        return results
     
-    def _score_sentences_tfidf(self, sentences: List[str]) -> List[Tuple[str, float]]:
-        """Score sentences using TF-IDF"""
+    def warmup_corpus(self, documents: List[str]):
+        """
+        Fit IDF weights once over a representative corpus
+
+        After warmup, sentence scoring is a tokenize + IDF lookup-sum per
+        sentence - no vectorizer fit per slide. Call with all slide text
+        up front when the whole deck is known in advance.
+
+        Args:
+            documents: Corpus to fit IDF weights on
+        """
+        if not SKLEARN_AVAILABLE or not documents:
+            return
+
+        vectorizer = TfidfVectorizer(stop_words='english', ngram_range=(1, 2))
+        vectorizer.fit(documents)
+        self._idf = dict(zip(vectorizer.get_feature_names_out(), vectorizer.idf_))
+
+    def _score_sentences_tfidf(self, sentences: List[str]) -> np.ndarray:
+        """Score sentences using TF-IDF, one score per sentence position"""
+        if self._idf:
+            # Warmed path: sum the prefitted IDF weights of known terms,
+            # skipping the per-corpus transform entirely
+            idf_get = self._idf.get
+            return np.fromiter(
+                (sum(idf_get(tok, 0.0) for tok in _TOKEN_RE.findall(sent.lower()))
+                 for sent in sentences),
+                dtype=np.float32,
+                count=len(sentences)
+            )
+
         try:
-            tfidf_matrix = self.vectorizer.fit_transform(sentences)
-            scores = np.array(tfidf_matrix.sum(axis=1)).flatten()
-            
-            return list(zip(sentences, scores))
+            tfidf_matrix = _hashed_tfidf(tuple(sentences))
+
+            # Row sums straight off the CSR arrays - no temporary sparse
+            # sum matrix or dense conversion
+            data = tfidf_matrix.data
+            indptr = tfidf_matrix.indptr
+            row_counts = np.diff(indptr)
+            scores = np.zeros(len(row_counts), dtype=data.dtype)
+            nonzero = row_counts > 0
+            if data.size:
+                scores[nonzero] = np.add.reduceat(data, indptr[:-1][nonzero])
+
+            return scores
         except:
             # Fallback to equal scores
-            return list(zip(sentences, [1.0] * len(sentences)))
-    
+            return np.ones(len(sentences), dtype=np.float32)
+
     def _get_top_sentences(
-        self, 
-        scored_sentences: List[Tuple[str, float]], 
+        self,
+        sentences: List[str],
+        scores: np.ndarray,
         n: int
     ) -> List[str]:
         """Get top N sentences maintaining original order"""
-        # Sort by score
-        sorted_sentences = sorted(
-            scored_sentences, 
-            key=lambda x: x[1], 
-            reverse=True
-        )
-        
-        # Get top N
-        top_n = sorted_sentences[:n]
-        
-        # Restore original order
-        sentence_to_score = {sent: score for sent, score in scored_sentences}
-        top_sentences = [sent for sent, _ in top_n]
-        top_sentences.sort(
-            key=lambda x: [s for s, _ in scored_sentences].index(x)
-        )
-        
-        return top_sentences
+        # Parallel arrays instead of (idx, sentence, score) tuples:
+        # argpartition selects the n best positions in O(len), and sorting
+        # just those indices restores document order
+        top_idx = np.argpartition(scores, -n)[-n:]
+        top_idx.sort()
+
+        return [sentences[i] for i in top_idx]
     
     def extract_keywords(self, text: str, top_n: int = 10) -> List[str]:
         """
-        Extract key terms using TF-IDF
-        
+        Extract key terms by frequency over stop-word-filtered 1-2grams
+
         Args:
             text: Input text
             top_n: Number of keywords to extract
@@ -154,42 +342,35 @@ class TextProcessor:
         Returns:
             List of keyword strings
         """
-        if not SKLEARN_AVAILABLE or not self.vectorizer:
+        if not SKLEARN_AVAILABLE:
             return self._simple_keyword_extract(text, top_n)
         
         try:
-            tfidf_matrix = self.vectorizer.fit_transform([text])
-            feature_names = self.vectorizer.get_feature_names_out()
-            scores = tfidf_matrix.toarray()[0]
-            
-            # Get top N keywords
-            top_indices = scores.argsort()[-top_n:][::-1]
-            keywords = [feature_names[i] for i in top_indices]
+            # On a single document IDF is a constant factor, so the old
+            # fit_transform([text]) reduced to term frequency at the cost
+            # of a full vectorizer fit. Count terms directly with the same
+            # tokenization: English stop words removed, unigrams plus
+            # bigrams over the filtered token stream.
+            tokens = [
+                tok for tok in _TOKEN_RE.findall(text.lower())
+                if tok not in ENGLISH_STOP_WORDS
+            ]
+            term_freq = Counter(tokens)
+            term_freq.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]))
             
-            return keywords
+            # Heap-based partial selection of the top N terms
+            return [term for term, _ in term_freq.most_common(top_n)]
         except Exception as e:
             self.error_handler.log_warning(f"Keyword extraction failed: {e}")
             return self._simple_keyword_extract(text, top_n)
     
     def _simple_keyword_extract(self, text: str, top_n: int) -> List[str]:
         """Simple frequency-based keyword extraction"""
-        # Remove punctuation and lowercase
-        words = re.findall(r'\b[a-z]{4,}\b', text.lower())
-        
-        # Count frequencies
-        word_freq = {}
-        for word in words:
-            if len(word) >= 4:  # Skip short words
-                word_freq[word] = word_freq.get(word, 0) + 1
-        
-        # Get top N
-        sorted_words = sorted(
-            word_freq.items(), 
-            key=lambda x: x[1], 
-            reverse=True
-        )
-        
-        return [word for word, _ in sorted_words[:top_n]]
+        # Counter's C-level counting plus heap-based most_common replaces
+        # the Python dict.get() loop and the redundant length re-check
+        word_freq = Counter(_KW_RE.findall(text.lower()))
+
+        return [word for word, _ in word_freq.most_common(top_n)]
     
     def truncate_smart(self, text: str, max_length: int) -> str:
         """
@@ -206,69 +387,49 @@ class TextProcessor:
             return text
         
         # Try to split at sentence boundary
-        if NLTK_AVAILABLE:
-            sentences = sent_tokenize(text)
-        else:
-            sentences = self._simple_sentence_split(text)
+        sentences = self._sent_tokenize(text)
         
-        result = ""
-        for sent in sentences:
-            if len(result) + len(sent) + 1 <= max_length:
-                result += sent + " "
-            else:
-                break
-        
-        result = result.strip()
+        # Cumulative joined lengths + one searchsorted replace the
+        # quadratic result += sent accumulation; the single join builds
+        # the kept prefix in one allocation
+        lengths = np.fromiter(
+            (len(s) for s in sentences), dtype=np.int64, count=len(sentences)
+        )
+        joined_lengths = np.cumsum(lengths + 1) - 1
+        cutoff = int(np.searchsorted(joined_lengths, max_length, side='left'))
+        result = " ".join(sentences[:cutoff])
         
         # Add ellipsis if truncated
         if result and len(result) < len(text):
             # Remove incomplete last sentence if any
             if not result.endswith(('.', '!', '?')):
-                # Find last complete sentence
-                last_end = max(
-                    result.rfind('.'),
-                    result.rfind('!'),
-                    result.rfind('?')
-                )
-                if last_end > 0:
-                    result = result[:last_end + 1]
+                # Find last complete sentence in a single pass
+                match = _LAST_PUNCT_RE.search(result)
+                if match and match.start() > 0:
+                    result = result[:match.start() + 1]
             result += "..."
         
         return result if result else text[:max_length] + "..."
     
     def _simple_sentence_split(self, text: str) -> List[str]:
         """Simple sentence splitting without NLTK"""
-        # Split on period, exclamation, question mark
-        sentences = re.split(r'[.!?]+', text)
+        # Split at punctuation-then-capital boundaries, keeping the
+        # terminators with their sentences like the Punkt path does
+        sentences = _SENT_BOUNDARY_RE.split(text)
         sentences = [s.strip() for s in sentences if s.strip()]
         return sentences
     
     def _clean_bullet(self, text: str) -> str:
-        """Clean and format bullet point text"""
-        text = text.strip()
-        
-        # Remove multiple spaces
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Capitalize first letter
-        if text and text[0].islower():
-            text = text[0].upper() + text[1:]
-        
-        # Ensure ends with period if not already punctuated
-        if text and text[-1] not in '.!?':
-            text += '.'
-        
-        return text
+        """Clean and format bullet point text (memoized per input)"""
+        return _clean_bullet_impl(text)
     
     def format_bullet_list(self, items: List[str]) -> List[str]:
         """Format list of items as proper bullet points"""
-        formatted = []
-        
-        for item in items:
-            cleaned = self._clean_bullet(item)
-            formatted.append(cleaned)
-        
-        return formatted
+        if len(items) >= _PARALLEL_MIN_ITEMS:
+            with ThreadPoolExecutor() as executor:
+                return list(executor.map(self._clean_bullet, items))
+
+        return [self._clean_bullet(item) for item in items]
     
     def split_long_content(
         self, 
@@ -289,26 +450,32 @@ class TextProcessor:
         """
         if len(content) <= max_items:
             return [content]
-        
-        slides = []
-        current_slide = []
-        
-        for item in content:
-            # Truncate individual items if too long
-            if len(item) > max_chars_per_item:
-                item = self.truncate_smart(item, max_chars_per_item)
-            
-            current_slide.append(item)
-            
-            if len(current_slide) >= max_items:
-                slides.append(current_slide)
-                current_slide = []
-        
-        # Add remaining items
-        if current_slide:
-            slides.append(current_slide)
-        
-        return slides
+
+        # Truncate only the over-length items, in parallel when there are
+        # enough of them; the mask keeps already-short items untouched
+        long_idxs = [
+            i for i, item in enumerate(content)
+            if len(item) > max_chars_per_item
+        ]
+        if long_idxs:
+            content = list(content)
+            if len(long_idxs) >= _PARALLEL_MIN_ITEMS:
+                with ThreadPoolExecutor() as executor:
+                    truncated = executor.map(
+                        lambda i: self.truncate_smart(content[i], max_chars_per_item),
+                        long_idxs
+                    )
+                    for i, item in zip(long_idxs, truncated):
+                        content[i] = item
+            else:
+                for i in long_idxs:
+                    content[i] = self.truncate_smart(content[i], max_chars_per_item)
+
+        # Chunk into slides by slicing - order is preserved
+        return [
+            content[i:i + max_items]
+            for i in range(0, len(content), max_items)
+        ]
     
     def rank_content_by_relevance(
         self, 
@@ -333,24 +500,39 @@ class TextProcessor:
             corpus = [query] + items
             
             # Fit TF-IDF
-            tfidf_matrix = self.vectorizer.fit_transform(corpus)
+            tfidf_matrix = _hashed_tfidf(tuple(corpus))
             
             # Calculate similarity to query (first item)
             query_vector = tfidf_matrix[0:1]
             item_vectors = tfidf_matrix[1:]
             
-            # Cosine similarity
-            similarities = (item_vectors * query_vector.T).toarray().flatten()
-            
-            # Sort items by similarity
-            ranked_items = [
-                item for _, item in sorted(
-                    zip(similarities, items), 
-                    reverse=True
+            # Cosine similarity (rows are L2-normalized by the TF-IDF
+            # transform, so plain dot products are cosines). The compiled
+            # kernel iterates the item rows' CSR arrays directly against a
+            # densified query, skipping the sparse matmul machinery.
+            if NUMBA_AVAILABLE:
+                query = np.zeros(tfidf_matrix.shape[1], dtype=tfidf_matrix.dtype)
+                query[query_vector.indices] = query_vector.data
+                similarities = _csr_dot_dense(
+                    item_vectors.data,
+                    item_vectors.indices,
+                    item_vectors.indptr,
+                    item_vectors.shape[0],
+                    query
                 )
-            ]
+            else:
+                # Broadcasted elementwise multiply + row sum avoids the
+                # sparse matmul's intermediate result matrix
+                similarities = np.asarray(
+                    item_vectors.multiply(query_vector).sum(axis=1)
+                ).ravel()
             
-            return ranked_items
+            # Sort items by similarity: argsort the scores and gather, so
+            # items never get compared as sort tie-breakers. The stable
+            # kind keeps equally-scored items in input order.
+            order = np.argsort(-similarities, kind='stable')
+
+            return [items[i] for i in order]
             
         except Exception as e:
             self.error_handler.log_warning(f"Content ranking failed: {e}")